@@ -1,8 +1,11 @@
 """The MELView Climate integration."""
 import asyncio
 from datetime import timedelta
+from functools import partial
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Set
 
 from aiohttp import ClientConnectionError, ClientSession
 from async_timeout import timeout
@@ -11,28 +14,62 @@ import pymelview.client
 import voluptuous as vol
 
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import (
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_STOP,
+)
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_time_interval,
+    async_track_utc_time_change,
+)
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.util import Throttle
 
 from .const import (
+    CONF_CONF_UPDATE_INTERVAL,
     CONF_DISABLE_SENSORS,
+    CONF_EXCLUDE_ROOM_SENSOR,
     CONF_LANGUAGE,
+    CONF_MAX_CONCURRENT,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SET_DEBOUNCE,
+    DEFAULT_CONF_UPDATE_INTERVAL,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SET_DEBOUNCE,
     DOMAIN,
     LANGUAGES,
     MEL_DEVICES,
+    MEL_HUB,
+    SIGNAL_DEVICE_UPDATE,
+    SIGNAL_FLEET_UPDATE,
     Language,
 )
+from .commands import CommandTracker, account_command_statistics
+from .session import async_create_melview_session
+from .statistics import UnitStatistics
+from .trend import TemperatureTrend
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
-MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=60)
-
 PLATFORMS = ["climate", "sensor", "binary_sensor"]
 
+STATISTICS_FLUSH_MINUTE = 5
+STATISTICS_STORAGE_VERSION = 1
+MAX_UPDATE_AGE = timedelta(seconds=10)
+STARTUP_REFRESH_SPACING = 0.5  # seconds
+# Delays between refreshes that look for the confirmation of a command.
+CONFIRM_REFRESH_DELAYS = (2, 3, 5, 10, 20, 40)  # seconds
+
 MELVIEW_SCHEMA = vol.Schema({
     vol.Required(CONF_USERNAME): str,
     vol.Required(CONF_PASSWORD): str,
@@ -76,6 +113,8 @@ class MelViewAuthentication:
 
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     """Establish connection with MELView."""
+    async_register_websocket_commands(hass)
+
     if DOMAIN not in config:
         return True
 
@@ -106,19 +145,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         str(mclanguage)
     )
 
-    mcauth = MelViewAuthentication(username, conf[CONF_PASSWORD], mclanguage)
+    hub = MelViewHub(hass, entry.options)
+    hub.session = async_create_melview_session()
+
+    async def async_close_session(event=None) -> None:
+        """Close the MELView session."""
+        await hub.session.close()
+
+    # Config entries are not unloaded on shutdown, so close on stop as well.
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_session)
+    )
+    entry.async_on_unload(async_close_session)
+
+    try:
+        await _async_setup_hub(hass, entry, hub, mclanguage)
+    except BaseException:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        await hub.session.close()
+        raise
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    return True
+
+
+async def _async_setup_hub(
+    hass: HomeAssistant, entry: ConfigEntry, hub: "MelViewHub", mclanguage: int
+) -> None:
+    """Log in, discover the devices and set up the platforms."""
+    conf = entry.data
+    mcauth = MelViewAuthentication(conf[CONF_USERNAME], conf[CONF_PASSWORD], mclanguage)
     try:
-        result: bool = await mcauth.login(async_get_clientsession(hass))
+        result: bool = await mcauth.login(hub.session)
         if not result:
             raise ConfigEntryNotReady()
     except:
         raise ConfigEntryNotReady()
 
     client = mcauth.getContextKey()
-    mel_devices = await mel_devices_setup(hass, client)
+    mel_devices = await mel_devices_setup(hass, client, hub)
+    await hub.async_restore_statistics(entry.entry_id)
+    # Config entries are not unloaded on shutdown, so save on stop as well.
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, hub.async_shutdown)
+    )
     hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {}).update(
         {
             MEL_DEVICES: mel_devices,
+            MEL_HUB: hub,
         }
     )
     disable_sensors = conf.get(CONF_DISABLE_SENSORS, False)
@@ -131,11 +206,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     await hass.config_entries.async_forward_entry_setups(entry, platforms)
 
-    return True
+    hub.async_start()
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry):
+    """Apply changed options to the running integration without a reload."""
+    hub: MelViewHub = hass.data[DOMAIN][entry.entry_id][MEL_HUB]
+    if entry.options.get(CONF_EXCLUDE_ROOM_SENSOR, False) != hub.exclude_room_sensor:
+        # Adding or removing entities needs the platforms to be set up again.
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    hub.apply_options(entry.options)
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Unload a config entry."""
+    hub: MelViewHub = hass.data[DOMAIN][config_entry.entry_id][MEL_HUB]
+    await hub.async_shutdown()
     await asyncio.gather(
         *[
             hass.config_entries.async_forward_entry_unload(config_entry, platform)
@@ -148,38 +235,314 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     return True
 
 
+class MelViewHub:
+    """Runtime settings and poll scheduler shared by the devices of an entry."""
+
+    def __init__(self, hass: HomeAssistant, options: Dict[str, Any]) -> None:
+        """Construct a hub from the config entry options."""
+        self.hass: HomeAssistant = hass
+        self.devices: List["MelViewDevice"] = []
+        self.session: Optional[ClientSession] = None
+        self.exclude_room_sensor: bool = options.get(CONF_EXCLUDE_ROOM_SENSOR, False)
+        self._started: bool = False
+        self._startup_task: Optional[asyncio.Task] = None
+        self._unsub_devices: Dict[Any, Any] = {}
+        self._unsub_fleet = None
+        self._unsub_statistics = None
+        self._inflight: Dict[Any, asyncio.Task] = {}
+        self._poll_tasks: Set[asyncio.Task] = set()
+        self._confirm_tasks: Dict[Any, asyncio.Task] = {}
+        self._statistics_store: Optional[Store] = None
+        self.apply_options(options)
+
+    @callback
+    def apply_options(self, options: Dict[str, Any]) -> None:
+        """Apply polling, write and request limits to the running devices."""
+        self.scan_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.conf_update_interval = timedelta(
+            minutes=options.get(CONF_CONF_UPDATE_INTERVAL, DEFAULT_CONF_UPDATE_INTERVAL)
+        )
+        self.set_debounce = timedelta(
+            seconds=options.get(CONF_SET_DEBOUNCE, DEFAULT_SET_DEBOUNCE)
+        )
+        self.max_concurrent: int = options.get(CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT)
+        self.request_timeout: int = options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+        # Requests already waiting keep the old semaphore, new ones use the new limit.
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        for mel_device in self.devices:
+            mel_device.apply_options()
+
+        if self._started:
+            self.async_stop()
+            self.async_start()
+
+    @callback
+    def async_start(self) -> None:
+        """Start polling all devices.
+
+        A startup refresh brings every device up straight away, starting them
+        a short fixed delay apart under the concurrency limit. Afterwards each
+        device is polled once per interval at its own phase: a hash of its ID
+        modulo the interval, counted from the Unix epoch. The phase therefore
+        does not depend on the other devices or on when setup ran.
+        """
+        self._started = True
+        self._startup_task = self.hass.async_create_task(self._async_startup())
+        self._unsub_fleet = async_track_time_interval(
+            self.hass, self._async_fleet_cycle, self.scan_interval
+        )
+        self._unsub_statistics = async_track_utc_time_change(
+            self.hass,
+            self._async_flush_statistics,
+            minute=STATISTICS_FLUSH_MINUTE,
+            second=0,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling."""
+        self._started = False
+        if self._startup_task is not None:
+            self._startup_task.cancel()
+            self._startup_task = None
+        for unsub in self._unsub_devices.values():
+            unsub()
+        self._unsub_devices.clear()
+        if self._unsub_fleet is not None:
+            self._unsub_fleet()
+            self._unsub_fleet = None
+        if self._unsub_statistics is not None:
+            self._unsub_statistics()
+            self._unsub_statistics = None
+
+    async def async_shutdown(self, event=None) -> None:
+        """Stop polling, cancel running requests and save the statistics."""
+        self.async_stop()
+        tasks = [
+            *self._poll_tasks,
+            *self._confirm_tasks.values(),
+            *self._inflight.values(),
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.async_save_statistics()
+
+    @property
+    def command_statistics(self) -> Dict[str, Any]:
+        """Return the command confirmation statistics of the account."""
+        return account_command_statistics(
+            [mel_device.commands for mel_device in self.devices]
+        )
+
+    async def async_refresh_device(self, mel_device: "MelViewDevice") -> None:
+        """Refresh a device, joining the request already in flight for it."""
+        device_id = mel_device.device_id
+        task = self._inflight.get(device_id)
+        if task is None:
+            task = self.hass.async_create_task(mel_device.async_fetch())
+            self._inflight[device_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(device_id, None))
+        # Shielded so that a cancelled caller does not cancel the others.
+        await asyncio.shield(task)
+
+    async def _async_startup(self) -> None:
+        """Refresh every device once, then start the per-device schedule."""
+        tasks = []
+        for mel_device in self.devices:
+            if tasks:
+                await asyncio.sleep(STARTUP_REFRESH_SPACING)
+            tasks.append(self._async_create_poll_task(mel_device))
+        await asyncio.gather(*tasks)
+        async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATE)
+
+        for mel_device in self.devices:
+            self._async_schedule_device(mel_device)
+
+    @callback
+    def _async_schedule_device(self, mel_device: "MelViewDevice") -> None:
+        """Schedule the next poll of a device at its phase in the interval."""
+        interval = self.scan_interval.total_seconds()
+        phase = zlib.crc32(str(mel_device.device_id).encode()) % int(interval * 1000)
+        delay = (phase / 1000 - time.time()) % interval
+        self._unsub_devices[mel_device.device_id] = async_call_later(
+            self.hass, delay, partial(self._async_poll_device, mel_device)
+        )
+
+    @callback
+    def _async_poll_device(self, mel_device: "MelViewDevice", now=None) -> None:
+        """Poll a device and schedule its next poll."""
+        self._async_schedule_device(mel_device)
+        self._async_create_poll_task(mel_device)
+
+    @callback
+    def async_confirm_commands(self, mel_device: "MelViewDevice") -> None:
+        """Refresh a device soon after a write until its commands are confirmed."""
+        device_id = mel_device.device_id
+        if (task := self._confirm_tasks.get(device_id)) is not None:
+            task.cancel()
+        task = self.hass.async_create_task(self._async_confirm(mel_device))
+        self._confirm_tasks[device_id] = task
+        task.add_done_callback(
+            lambda done: self._confirm_tasks.pop(device_id, None)
+            if self._confirm_tasks.get(device_id) is done
+            else None
+        )
+
+    async def _async_confirm(self, mel_device: "MelViewDevice") -> None:
+        """Refresh a device with backoff while it has pending commands."""
+        for delay in CONFIRM_REFRESH_DELAYS:
+            await asyncio.sleep(delay)
+            if not mel_device.commands.pending:
+                return
+            await self.async_refresh_device(mel_device)
+
+    @callback
+    def _async_create_poll_task(self, mel_device: "MelViewDevice") -> asyncio.Task:
+        """Start a tracked poll of a device."""
+        task = self.hass.async_create_task(self._async_poll(mel_device))
+        self._poll_tasks.add(task)
+        task.add_done_callback(self._poll_tasks.discard)
+        return task
+
+    async def _async_poll(self, mel_device: "MelViewDevice") -> None:
+        """Refresh a device unless it was refreshed recently."""
+        # Devices refreshed recently, e.g. by update_entity or before an
+        # options change restarted the schedule, wait for their next phase.
+        await mel_device.async_update(max_age=self.scan_interval / 2)
+
+    @callback
+    def _async_fleet_cycle(self, now=None) -> None:
+        """Announce the end of a poll interval."""
+        async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATE)
+
+    async def async_restore_statistics(self, entry_id: str) -> None:
+        """Resume the hourly statistics saved by the previous run."""
+        self._statistics_store = Store(
+            self.hass, STATISTICS_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.statistics"
+        )
+        saved = await self._statistics_store.async_load() or {}
+        for mel_device in self.devices:
+            mel_device.statistics.restore(saved.get(str(mel_device.device_id), {}))
+
+    async def async_save_statistics(self, event=None) -> None:
+        """Import the finished hours and keep the current one for the next run."""
+        await self._async_flush_statistics()
+        if self._statistics_store is not None:
+            await self._statistics_store.async_save(
+                {
+                    str(mel_device.device_id): mel_device.statistics.as_dict()
+                    for mel_device in self.devices
+                }
+            )
+
+    async def _async_flush_statistics(self, now=None) -> None:
+        """Import the finished hours of every device into the recorder."""
+        for mel_device in self.devices:
+            if "recorder" in self.hass.config.components:
+                await mel_device.statistics.async_flush(self.hass)
+            else:
+                mel_device.statistics.clear()
+
+
 class MelViewDevice:
     """MELView Device instance."""
 
-    def __init__(self, device: Device) -> None:
+    def __init__(self, device: Device, hub: MelViewHub) -> None:
         """Construct a device wrapper."""
         self.device: Device = device
         self.name: str = device.name
-        self._available = True
-
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self) -> None:
-        """Pull the latest data from MELView."""
+        self.hub: MelViewHub = hub
+        self._available = False
+        self._last_update: Optional[float] = None
+        self._last_success: Optional[float] = None
+        self.trend = TemperatureTrend()
+        self.statistics = UnitStatistics(device.device_id, device.name)
+        self.commands = CommandTracker(device.name)
+
+    def apply_options(self) -> None:
+        """Push the hub write and config refresh settings into pymelview."""
+        # These mirror the get_devices() keyword arguments, which pymelview
+        # only reads when the devices are created.
+        self.device._set_debounce = self.hub.set_debounce
+        self.device._client._conf_update_interval = self.hub.conf_update_interval
+
+    async def async_update(self, max_age: timedelta = MAX_UPDATE_AGE) -> None:
+        """Pull the latest data from MELView unless it is younger than max_age."""
+        if (
+            self._last_update is not None
+            and time.monotonic() - self._last_update < max_age.total_seconds()
+        ):
+            return
+        await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Pull the latest data from MELView, sharing concurrent requests."""
+        await self.hub.async_refresh_device(self)
+
+    async def async_fetch(self) -> None:
+        """Request the device state from MELView."""
         try:
-            await self.device.update()
+            async with self.hub.semaphore:
+                async with timeout(self.hub.request_timeout):
+                    await self.device.update()
             self._available = True
-        except ClientConnectionError:
+            self._last_success = time.monotonic()
+            self.trend.add(
+                self.device.room_temperature, self.device.target_temperature
+            )
+            self.statistics.add(
+                self.device.room_temperature,
+                self.device.target_temperature,
+                self.device.power,
+            )
+            self.commands.check(self.device)
+        except (asyncio.TimeoutError, ClientConnectionError):
             _LOGGER.warning("Connection failed for %s", self.name)
             self._available = False
+        self._last_update = time.monotonic()
+        async_dispatcher_send(
+            self.hub.hass, SIGNAL_DEVICE_UPDATE.format(self.device_id)
+        )
 
     async def async_set(self, properties: Dict[str, Any]) -> None:
         """Write state changes to the MELView API."""
+        requested_at = time.monotonic()
+        # pymelview updates its state from the write response, so read it first.
+        reported = self.commands.reported(self.device)
         try:
-            await self.device.set(properties)
+            async with self.hub.semaphore:
+                # pymelview waits for the debounce before sending the write.
+                async with timeout(
+                    self.hub.request_timeout + self.hub.set_debounce.total_seconds()
+                ):
+                    await self.device.set(properties)
             self._available = True
-        except ClientConnectionError:
+            # Only writes MELView accepted can be confirmed by the unit.
+            self.commands.add(properties, requested_at, reported)
+            if self.commands.pending:
+                self.hub.async_confirm_commands(self)
+        except (asyncio.TimeoutError, ClientConnectionError):
             _LOGGER.warning("Connection failed for %s", self.name)
             self._available = False
+        async_dispatcher_send(
+            self.hub.hass, SIGNAL_DEVICE_UPDATE.format(self.device_id)
+        )
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._available
+        """Return True once the device has reported its state."""
+        return self._available and self._last_success is not None
+
+    @property
+    def last_update_age(self) -> Optional[float]:
+        """Return the seconds since the last successful update."""
+        if self._last_success is None:
+            return None
+        return time.monotonic() - self._last_success
 
     @property
     def device_id(self):
@@ -224,21 +587,23 @@ class MelViewDevice:
         return _device_info
 
 
-async def mel_devices_setup(hass: HomeAssistant, client) -> List[MelViewDevice]:
+async def mel_devices_setup(
+    hass: HomeAssistant, client, hub: MelViewHub
+) -> List[MelViewDevice]:
     """Query connected devices from MELView."""
-    session: ClientSession = async_get_clientsession(hass)
     try:
-        with timeout(10):
+        with timeout(hub.request_timeout):
             all_devices = await get_devices(
                 client,
-                session,
-                conf_update_interval=timedelta(minutes=5),
-                device_set_debounce=timedelta(seconds=1),
+                hub.session,
+                conf_update_interval=hub.conf_update_interval,
+                device_set_debounce=hub.set_debounce,
             )
     except (asyncio.TimeoutError, ClientConnectionError) as ex:
         raise ConfigEntryNotReady() from ex
 
     wrapped_devices = {}
     for device_type, devices in all_devices.items():
-        wrapped_devices[device_type] = [MelViewDevice(device) for device in devices]
+        wrapped_devices[device_type] = [MelViewDevice(device, hub) for device in devices]
+        hub.devices.extend(wrapped_devices[device_type])
     return wrapped_devices
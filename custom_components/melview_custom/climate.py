@@ -1,5 +1,4 @@
 """Platform for climate integration."""
-from datetime import timedelta
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -16,6 +15,7 @@ from homeassistant.components.climate.const import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import UnitOfTemperature
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import MelViewDevice
@@ -25,14 +25,13 @@ from .const import (
     ATTR_VANE_HORIZONTAL,
     DOMAIN,
     MEL_DEVICES,
+    SIGNAL_DEVICE_UPDATE,
     HorSwingModes,
     VertSwingModes,
 )
 
 from homeassistant.components.climate import ClimateEntity
 
-SCAN_INTERVAL = timedelta(seconds=60)
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -81,7 +80,7 @@ async def async_setup_entry(
             AtaDeviceClimate(mel_device, mel_device.device)
             for mel_device in mel_devices[DEVICE_TYPE_ATA]
         ],
-        True,
+        False,
     )
 
 
@@ -94,10 +93,30 @@ class MelViewClimate(ClimateEntity):
         self._base_device = self.api.device
         self._name = device.name
 
+    @property
+    def should_poll(self) -> bool:
+        """Return False, the hub schedules device updates."""
+        return False
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATE.format(self.api.device_id),
+                self.async_write_ha_state,
+            )
+        )
+
     async def async_update(self):
         """Update state from MELView."""
         await self.api.async_update()
 
+    @property
+    def available(self) -> bool:
+        """Return True if the device state is known."""
+        return self.api.available
+
     @property
     def device_info(self):
         """Return a device description for device registry."""
@@ -146,6 +165,8 @@ class AtaDeviceClimate(MelViewClimate):
             attr.update(
                 {ATTR_VANE_VERTICAL: ATA_HVAC_VVANE_LOOKUP.get(vane_vertical, None)}
             )
+
+        attr.update(self.api.commands.attributes)
         return attr
 
     @property
@@ -164,7 +185,7 @@ class AtaDeviceClimate(MelViewClimate):
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         if hvac_mode == HVACMode.OFF:
-            await self._device.set({PROPERTY_POWER: False})
+            await self.api.async_set({PROPERTY_POWER: False})
             return
 
         operation_mode = ATA_HVAC_MODE_REVERSE_LOOKUP.get(hvac_mode)
@@ -174,7 +195,7 @@ class AtaDeviceClimate(MelViewClimate):
         props = {ata.PROPERTY_OPERATION_MODE: operation_mode}
         if self.hvac_mode == HVACMode.OFF:
             props[PROPERTY_POWER] = True
-        await self._device.set(props)
+        await self.api.async_set(props)
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
@@ -195,7 +216,7 @@ class AtaDeviceClimate(MelViewClimate):
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
-        await self._device.set(
+        await self.api.async_set(
             {ata.PROPERTY_TARGET_TEMPERATURE: kwargs.get("temperature", self.target_temperature)}
         )
 
@@ -206,7 +227,7 @@ class AtaDeviceClimate(MelViewClimate):
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
-        await self._device.set({ata.PROPERTY_FAN_SPEED: fan_mode})
+        await self.api.async_set({ata.PROPERTY_FAN_SPEED: fan_mode})
 
     @property
     def fan_modes(self) -> Optional[List[str]]:
@@ -254,7 +275,7 @@ class AtaDeviceClimate(MelViewClimate):
 
         self._set_hor_swing = is_hor_swing
         if curr_mode != operation_mode:
-            await self._device.set(props)
+            await self.api.async_set(props)
 
     @property
     def swing_modes(self) -> Optional[List[str]]:
@@ -270,11 +291,11 @@ class AtaDeviceClimate(MelViewClimate):
 
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
-        await self._device.set({PROPERTY_POWER: True})
+        await self.api.async_set({PROPERTY_POWER: True})
 
     async def async_turn_off(self) -> None:
         """Turn the entity off."""
-        await self._device.set({PROPERTY_POWER: False})
+        await self.api.async_set({PROPERTY_POWER: False})
 
     @property
     def supported_features(self) -> int:
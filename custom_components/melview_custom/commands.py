@@ -0,0 +1,177 @@
+"""Command confirmation tracking for MELView devices."""
+from datetime import timedelta
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from pymelview import Device
+import pymelview.ata_device as ata
+from pymelview.device import PROPERTY_POWER
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_TIMEOUT = timedelta(minutes=5)
+DEFAULT_TEMPERATURE_INCREMENT = 0.5
+
+ATTR_PENDING_COMMANDS = "pending_commands"
+ATTR_CONFIRMED_COMMANDS = "confirmed_commands"
+ATTR_COMMAND_TIMEOUTS = "command_timeouts"
+ATTR_LAST_COMMAND_LATENCY = "last_command_latency"
+ATTR_MEAN_COMMAND_LATENCY = "mean_command_latency"
+
+# Device attribute reporting the value written by each property.
+PROPERTY_STATUS_LOOKUP = {
+    PROPERTY_POWER: "power",
+    ata.PROPERTY_TARGET_TEMPERATURE: "target_temperature",
+    ata.PROPERTY_OPERATION_MODE: "operation_mode",
+    ata.PROPERTY_FAN_SPEED: "fan_speed",
+    ata.PROPERTY_VANE_HORIZONTAL: "vane_horizontal",
+    ata.PROPERTY_VANE_VERTICAL: "vane_vertical",
+}
+
+
+def _tolerance(device: Device) -> float:
+    """Return how far a reported setpoint may be from the requested one."""
+    # Units snap setpoints to their temperature step.
+    increment = (
+        getattr(device, "temperature_increment", None)
+        or DEFAULT_TEMPERATURE_INCREMENT
+    )
+    return increment / 2
+
+
+def _matches(requested: Any, reported: Any, tolerance: float) -> bool:
+    """Return True if a reported status value matches the requested one."""
+    if isinstance(requested, float) or isinstance(reported, float):
+        if requested is None or reported is None:
+            return False
+        return abs(float(requested) - float(reported)) <= tolerance
+    return requested == reported
+
+
+class _Command:
+    """A write waiting for the device status to reflect it."""
+
+    def __init__(self, properties: Dict[str, Any], requested_at: float) -> None:
+        """Construct a pending command."""
+        self.properties: Dict[str, Any] = {
+            key: value
+            for key, value in properties.items()
+            if key in PROPERTY_STATUS_LOOKUP
+        }
+        self.requested_at: float = requested_at
+
+
+class CommandTracker:
+    """Match written properties against later status updates of a device."""
+
+    def __init__(self, name: str) -> None:
+        """Construct an empty tracker."""
+        self._name: str = name
+        self._pending: List[_Command] = []
+        self.confirmed: int = 0
+        self.timeouts: int = 0
+        self.latency_total: float = 0.0
+        self.last_latency: Optional[float] = None
+        self._tolerance: float = DEFAULT_TEMPERATURE_INCREMENT / 2
+
+    @property
+    def pending(self) -> int:
+        """Return the number of commands not confirmed yet."""
+        return len(self._pending)
+
+    def reported(self, device: Device) -> Dict[str, Any]:
+        """Return the tracked values the device reports before a write."""
+        self._tolerance = _tolerance(device)
+        return {
+            key: getattr(device, attribute)
+            for key, attribute in PROPERTY_STATUS_LOOKUP.items()
+        }
+
+    def add(
+        self,
+        properties: Dict[str, Any],
+        now: Optional[float] = None,
+        reported: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a command sent to the device.
+
+        Properties whose value the device already reported before the write
+        are not tracked, they would only confirm on the next status update.
+        """
+        if now is None:
+            now = time.monotonic()
+        command = _Command(properties, now)
+
+        # A newer write of the same property supersedes the older one.
+        for older in self._pending:
+            for key in command.properties:
+                older.properties.pop(key, None)
+        self._pending = [older for older in self._pending if older.properties]
+
+        if reported is not None:
+            command.properties = {
+                key: value
+                for key, value in command.properties.items()
+                if not _matches(value, reported.get(key), self._tolerance)
+            }
+        if command.properties:
+            self._pending.append(command)
+
+    def check(self, device: Device, now: Optional[float] = None) -> None:
+        """Confirm or expire pending commands against the device status."""
+        if now is None:
+            now = time.monotonic()
+        tolerance = _tolerance(device)
+
+        pending = []
+        for command in self._pending:
+            if all(
+                _matches(
+                    value, getattr(device, PROPERTY_STATUS_LOOKUP[key]), tolerance
+                )
+                for key, value in command.properties.items()
+            ):
+                self.last_latency = now - command.requested_at
+                self.latency_total += self.last_latency
+                self.confirmed += 1
+            elif now - command.requested_at > COMMAND_TIMEOUT.total_seconds():
+                _LOGGER.warning(
+                    "%s did not confirm %s within %s",
+                    self._name,
+                    command.properties,
+                    COMMAND_TIMEOUT,
+                )
+                self.timeouts += 1
+            else:
+                pending.append(command)
+        self._pending = pending
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """Return the command statistics as state attributes."""
+        return {
+            ATTR_PENDING_COMMANDS: self.pending,
+            ATTR_CONFIRMED_COMMANDS: self.confirmed,
+            ATTR_COMMAND_TIMEOUTS: self.timeouts,
+            ATTR_LAST_COMMAND_LATENCY: (
+                round(self.last_latency, 1) if self.last_latency is not None else None
+            ),
+            ATTR_MEAN_COMMAND_LATENCY: (
+                round(self.latency_total / self.confirmed, 1) if self.confirmed else None
+            ),
+        }
+
+
+def account_command_statistics(trackers: List[CommandTracker]) -> Dict[str, Any]:
+    """Return the command statistics of all devices of an account."""
+    confirmed = sum(tracker.confirmed for tracker in trackers)
+    latency_total = sum(tracker.latency_total for tracker in trackers)
+    return {
+        ATTR_PENDING_COMMANDS: sum(tracker.pending for tracker in trackers),
+        ATTR_CONFIRMED_COMMANDS: confirmed,
+        ATTR_COMMAND_TIMEOUTS: sum(tracker.timeouts for tracker in trackers),
+        ATTR_MEAN_COMMAND_LATENCY: (
+            round(latency_total / confirmed, 1) if confirmed else None
+        ),
+    }
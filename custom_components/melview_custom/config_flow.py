@@ -4,13 +4,30 @@ import logging
 
 from aiohttp import ClientError, ClientResponseError
 from async_timeout import timeout
+import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
 from homeassistant.core import callback
 
-from .const import DOMAIN, CONF_LANGUAGE, LANGUAGES  # pylint: disable=unused-import
+from .const import (  # pylint: disable=unused-import
+    CONF_CONF_UPDATE_INTERVAL,
+    CONF_EXCLUDE_ROOM_SENSOR,
+    CONF_LANGUAGE,
+    CONF_MAX_CONCURRENT,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SET_DEBOUNCE,
+    DEFAULT_CONF_UPDATE_INTERVAL,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SET_DEBOUNCE,
+    DOMAIN,
+    LANGUAGES,
+    MAX_CONCURRENT_LIMIT,
+)
 from . import MELVIEW_SCHEMA, MelViewAuthentication
+from .session import async_create_melview_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +37,12 @@ class FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def _create_entry(self, user_input):
         """Register new entry."""
         username = user_input[CONF_USERNAME]
@@ -62,7 +85,8 @@ class FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_authorization(self, username, password, language):
         mcauth = MelViewAuthentication(username, password, LANGUAGES[language])
-        return await mcauth.login(self.hass.helpers.aiohttp_client.async_get_clientsession())
+        async with async_create_melview_session() as session:
+            return await mcauth.login(session)
 
     async def async_step_user(self, user_input=None):
         """User initiated config flow."""
@@ -84,3 +108,46 @@ class FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=MELVIEW_SCHEMA,
             errors=errors if errors else {},
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle MELView polling and request options."""
+
+    def __init__(self, config_entry):
+        """Initialize the options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        options_schema = vol.Schema({
+            vol.Optional(
+                CONF_SCAN_INTERVAL,
+                default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Optional(
+                CONF_CONF_UPDATE_INTERVAL,
+                default=options.get(CONF_CONF_UPDATE_INTERVAL, DEFAULT_CONF_UPDATE_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+            vol.Optional(
+                CONF_SET_DEBOUNCE,
+                default=options.get(CONF_SET_DEBOUNCE, DEFAULT_SET_DEBOUNCE),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=30)),
+            vol.Optional(
+                CONF_MAX_CONCURRENT,
+                default=options.get(CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENT_LIMIT)),
+            vol.Optional(
+                CONF_REQUEST_TIMEOUT,
+                default=options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+            vol.Optional(
+                CONF_EXCLUDE_ROOM_SENSOR,
+                default=options.get(CONF_EXCLUDE_ROOM_SENSOR, False),
+            ): bool,
+        })
+
+        return self.async_show_form(step_id="init", data_schema=options_schema)
@@ -2,9 +2,25 @@
 
 DOMAIN = "melview_custom"
 MEL_DEVICES = "mel_devices"
+MEL_HUB = "mel_hub"
+
+SIGNAL_DEVICE_UPDATE = "melview_custom_device_update_{}"
+SIGNAL_FLEET_UPDATE = "melview_custom_fleet_update"
 
 CONF_LANGUAGE = "language"
 CONF_DISABLE_SENSORS = "disable_sensors"
+CONF_CONF_UPDATE_INTERVAL = "conf_update_interval"
+CONF_SET_DEBOUNCE = "set_debounce"
+CONF_MAX_CONCURRENT = "max_concurrent_requests"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_EXCLUDE_ROOM_SENSOR = "exclude_room_temperature_sensor"
+
+DEFAULT_SCAN_INTERVAL = 60  # seconds
+DEFAULT_CONF_UPDATE_INTERVAL = 5  # minutes
+DEFAULT_SET_DEBOUNCE = 1.0  # seconds
+DEFAULT_MAX_CONCURRENT = 4
+MAX_CONCURRENT_LIMIT = 32
+DEFAULT_REQUEST_TIMEOUT = 10  # seconds
 
 ATTR_STATUS = "status"
 ATTR_VANE_VERTICAL = "vane_vertical"
@@ -5,6 +5,7 @@ from pymelview import DEVICE_TYPE_ATA
 
 from homeassistant.const import (
     UnitOfTemperature,
+    UnitOfTime,
     STATE_ON,
     STATE_OFF
 )
@@ -12,10 +13,11 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
 )
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 
 from . import MelViewDevice
-from .const import DOMAIN, MEL_DEVICES
+from .const import DOMAIN, MEL_DEVICES, SIGNAL_DEVICE_UPDATE
 
 ATTR_MEASUREMENT_NAME = "measurement_name"
 ATTR_ICON = "icon"
@@ -34,10 +36,29 @@ ATA_SENSORS = {
         ATTR_UNIT: UnitOfTemperature.CELSIUS,
         ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE,
         ATTR_VALUE_FN: lambda x: x.device.room_temperature,
+        ATTR_ENABLED_FN: lambda x: not x.hub.exclude_room_sensor,
+    },
+    "temperature_rate": {
+        ATTR_MEASUREMENT_NAME: "Temperature Rate",
+        ATTR_ICON: "mdi:thermometer-lines",
+        ATTR_UNIT: f"{UnitOfTemperature.CELSIUS}/h",
+        ATTR_DEVICE_CLASS: None,
+        ATTR_VALUE_FN: lambda x: x.trend.rate,
+        ATTR_ENABLED_FN: lambda x: True,
+    },
+    "time_to_target": {
+        ATTR_MEASUREMENT_NAME: "Time To Target",
+        ATTR_ICON: "mdi:timer-sand",
+        ATTR_UNIT: UnitOfTime.MINUTES,
+        ATTR_DEVICE_CLASS: SensorDeviceClass.DURATION,
+        ATTR_VALUE_FN: lambda x: x.trend.minutes_to_target if x.device.power else None,
         ATTR_ENABLED_FN: lambda x: True,
     },
 }
 
+# Measurements registered before per-measurement unique IDs were introduced.
+LEGACY_UNIQUE_ID_MEASUREMENTS = ("room_temperature", "error_state")
+
 ATA_BINARY_SENSORS = {
     "error_state": {
         ATTR_MEASUREMENT_NAME: "Error State",
@@ -88,7 +109,9 @@ class MelDeviceSensor(Entity):
     @property
     def unique_id(self):
         """Return a unique ID."""
-        return f"melview_custom_heatpump_{self._api.device.device_id}"
+        if self._measurement in LEGACY_UNIQUE_ID_MEASUREMENTS:
+            return f"melview_custom_heatpump_{self._api.device.device_id}"
+        return f"melview_custom_heatpump_{self._api.device.device_id}_{self._measurement}"
 
     @property
     def icon(self):
@@ -126,10 +149,30 @@ class MelDeviceSensor(Entity):
         """Return device class."""
         return self._def[ATTR_DEVICE_CLASS]
 
+    @property
+    def should_poll(self):
+        """Return False, the hub schedules device updates."""
+        return False
+
+    async def async_added_to_hass(self):
+        """Subscribe to device updates."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATE.format(self._api.device_id),
+                self.async_write_ha_state,
+            )
+        )
+
     async def async_update(self):
         """Retrieve latest state."""
         await self._api.async_update()
 
+    @property
+    def available(self):
+        """Return True if the device state is known."""
+        return self._api.available
+
     @property
     def device_info(self):
         """Return a device description for device registry."""
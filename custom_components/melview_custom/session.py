@@ -0,0 +1,30 @@
+"""HTTP session for MELView traffic."""
+from aiohttp import ClientSession, CookieJar, TCPConnector
+
+from homeassistant.util.ssl import get_default_context
+
+from .const import MAX_CONCURRENT_LIMIT
+
+MELVIEW_DNS_CACHE_TTL = 300  # seconds
+MELVIEW_KEEPALIVE_TIMEOUT = 120  # seconds
+
+
+def async_create_melview_session() -> ClientSession:
+    """Create a cookie isolated session tuned for polling the MELView host.
+
+    Idle connections are kept open across poll cycles so that refreshes reuse
+    the TLS connection, resolved addresses are cached for longer than the
+    aiohttp default, and the per-host limit is the highest concurrency the
+    options allow. The hub semaphore enforces the configured limit, so it can
+    change without rebuilding the session.
+    """
+    connector = TCPConnector(
+        limit_per_host=MAX_CONCURRENT_LIMIT,
+        keepalive_timeout=MELVIEW_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=MELVIEW_DNS_CACHE_TTL,
+        ssl=get_default_context(),
+    )
+    return ClientSession(
+        connector=connector,
+        cookie_jar=CookieJar(),
+    )
@@ -0,0 +1,230 @@
+"""Hourly long-term statistics for MELView devices."""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+from homeassistant.util.unit_conversion import DurationConverter, TemperatureConverter
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.4 only knows has_mean.
+    StatisticMeanType = None
+
+from .const import DOMAIN
+
+STATISTIC_ROOM_TEMPERATURE = "room_temperature"
+STATISTIC_TARGET_TEMPERATURE = "target_temperature"
+STATISTIC_ON_TIME = "on_time"
+
+STATISTICS = {
+    STATISTIC_ROOM_TEMPERATURE: (
+        "Room Temperature", UnitOfTemperature.CELSIUS, TemperatureConverter.UNIT_CLASS
+    ),
+    STATISTIC_TARGET_TEMPERATURE: (
+        "Target Temperature", UnitOfTemperature.CELSIUS, TemperatureConverter.UNIT_CLASS
+    ),
+    STATISTIC_ON_TIME: ("On Time", UnitOfTime.HOURS, DurationConverter.UNIT_CLASS),
+}
+
+# Longer gaps between samples are not counted as on-time.
+STATISTICS_MAX_GAP = timedelta(minutes=15)
+
+
+class _Series:
+    """Running mean, minimum and maximum of a value within one hour."""
+
+    def __init__(self) -> None:
+        """Construct an empty series."""
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: Optional[float]) -> None:
+        """Add a sample."""
+        if value is None:
+            return
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def as_list(self) -> list:
+        """Return the series in a JSON friendly form."""
+        return [self.count, self.total, self.min, self.max]
+
+    @classmethod
+    def from_list(cls, data: list) -> "_Series":
+        """Rebuild a series saved with as_list."""
+        series = cls()
+        series.count, series.total, series.min, series.max = data
+        return series
+
+    def data(self, start: datetime) -> Optional[StatisticData]:
+        """Return the hourly statistic row, if any sample was added."""
+        if not self.count:
+            return None
+        return StatisticData(
+            start=start,
+            mean=self.total / self.count,
+            min=self.min,
+            max=self.max,
+        )
+
+
+class UnitStatistics:
+    """Aggregate one unit's status samples into hourly external statistics."""
+
+    def __init__(self, device_id, name: str) -> None:
+        """Construct an empty aggregator."""
+        self._device_id = device_id
+        self._name: str = name
+        self._hour_start: Optional[datetime] = None
+        self._room = _Series()
+        self._target = _Series()
+        self._on_seconds: float = 0.0
+        self._last_sample: Optional[datetime] = None
+        self._last_power: bool = False
+        self._on_time_sum: Optional[float] = None
+        self._pending: Dict[str, List[StatisticData]] = {
+            statistic: [] for statistic in STATISTICS
+        }
+
+    def statistic_id(self, statistic: str) -> str:
+        """Return the external statistic ID of a unit statistic."""
+        return f"{DOMAIN}:{statistic}_{self._device_id}"
+
+    def add(
+        self,
+        room_temperature: Optional[float],
+        target_temperature: Optional[float],
+        power: Optional[bool],
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Record a status sample."""
+        if now is None:
+            now = dt_util.utcnow()
+        hour_start = now.replace(minute=0, second=0, microsecond=0)
+
+        on_since: Optional[datetime] = None
+        if (
+            self._last_sample is not None
+            and self._last_power
+            and now - self._last_sample <= STATISTICS_MAX_GAP
+        ):
+            on_since = self._last_sample
+
+        if self._hour_start is not None and hour_start != self._hour_start:
+            if on_since is not None and on_since < hour_start:
+                self._on_seconds += (hour_start - on_since).total_seconds()
+                on_since = hour_start
+            self._close_hour()
+
+        self._hour_start = hour_start
+        if on_since is not None:
+            self._on_seconds += (now - on_since).total_seconds()
+        self._room.add(room_temperature)
+        self._target.add(target_temperature)
+        self._last_sample = now
+        self._last_power = bool(power)
+
+    def _close_hour(self) -> None:
+        """Queue the rows of the finished hour and start a new one."""
+        start = self._hour_start
+        for statistic, series in (
+            (STATISTIC_ROOM_TEMPERATURE, self._room),
+            (STATISTIC_TARGET_TEMPERATURE, self._target),
+        ):
+            row = series.data(start)
+            if row is not None:
+                self._pending[statistic].append(row)
+        self._pending[STATISTIC_ON_TIME].append(
+            StatisticData(start=start, state=self._on_seconds / 3600)
+        )
+
+        self._room = _Series()
+        self._target = _Series()
+        self._on_seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the unfinished hour in a JSON friendly form."""
+        if self._hour_start is None:
+            return {}
+        return {
+            "hour_start": self._hour_start.isoformat(),
+            "room": self._room.as_list(),
+            "target": self._target.as_list(),
+            "on_seconds": self._on_seconds,
+            "last_sample": self._last_sample.isoformat(),
+            "last_power": self._last_power,
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """Resume the unfinished hour saved with as_dict.
+
+        If the hour has already ended, the next sample closes it as usual.
+        """
+        if not data:
+            return
+        self._hour_start = dt_util.parse_datetime(data["hour_start"])
+        self._room = _Series.from_list(data["room"])
+        self._target = _Series.from_list(data["target"])
+        self._on_seconds = data["on_seconds"]
+        self._last_sample = dt_util.parse_datetime(data["last_sample"])
+        self._last_power = data["last_power"]
+
+    def _metadata(self, statistic: str) -> StatisticMetaData:
+        """Return the recorder metadata of a unit statistic."""
+        name, unit, unit_class = STATISTICS[statistic]
+        has_mean = statistic != STATISTIC_ON_TIME
+        metadata = StatisticMetaData(
+            has_sum=statistic == STATISTIC_ON_TIME,
+            name=f"{self._name} {name}",
+            source=DOMAIN,
+            statistic_id=self.statistic_id(statistic),
+            unit_of_measurement=unit,
+        )
+        if StatisticMeanType is None:
+            metadata["has_mean"] = has_mean
+        else:
+            metadata["mean_type"] = (
+                StatisticMeanType.ARITHMETIC if has_mean else StatisticMeanType.NONE
+            )
+            metadata["unit_class"] = unit_class
+        return metadata
+
+    def clear(self) -> None:
+        """Drop the queued rows."""
+        for rows in self._pending.values():
+            rows.clear()
+
+    async def async_flush(self, hass: HomeAssistant) -> None:
+        """Import the queued hourly rows, one recorder call per statistic."""
+        on_time_rows = self._pending[STATISTIC_ON_TIME]
+        if on_time_rows and self._on_time_sum is None:
+            statistic_id = self.statistic_id(STATISTIC_ON_TIME)
+            last = await get_instance(hass).async_add_executor_job(
+                get_last_statistics, hass, 1, statistic_id, False, {"sum"}
+            )
+            self._on_time_sum = 0.0
+            if last:
+                self._on_time_sum = last[statistic_id][0].get("sum") or 0.0
+        for row in on_time_rows:
+            self._on_time_sum += row["state"]
+            row["sum"] = self._on_time_sum
+
+        for statistic, rows in self._pending.items():
+            if not rows:
+                continue
+            async_add_external_statistics(
+                hass, self._metadata(statistic), list(rows)
+            )
+        self.clear()
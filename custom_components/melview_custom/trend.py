@@ -0,0 +1,91 @@
+"""Temperature trend tracking for MELView devices."""
+from collections import deque
+import time
+from typing import Deque, Optional, Tuple
+
+TREND_BUFFER_SIZE = 30
+TREND_MIN_SPAN = 5 / 60  # hours
+TREND_TARGET_TOLERANCE = 0.25
+
+
+class TemperatureTrend:
+    """Fixed-size ring buffer of room and target temperature samples.
+
+    A least-squares fit of room temperature over time is kept up to date with
+    running sums, so adding a sample and reading the rate are both O(1).
+    """
+
+    def __init__(self, size: int = TREND_BUFFER_SIZE) -> None:
+        """Construct an empty trend buffer."""
+        self._samples: Deque[Tuple[float, float]] = deque()
+        self._size: int = size
+        self._origin: Optional[float] = None
+        self._sum_t: float = 0.0
+        self._sum_y: float = 0.0
+        self._sum_tt: float = 0.0
+        self._sum_ty: float = 0.0
+        self._room_temperature: Optional[float] = None
+        self._target_temperature: Optional[float] = None
+
+    def add(
+        self,
+        room_temperature: Optional[float],
+        target_temperature: Optional[float],
+        now: Optional[float] = None,
+    ) -> None:
+        """Record a status sample."""
+        self._target_temperature = target_temperature
+        if room_temperature is None:
+            return
+
+        if now is None:
+            now = time.monotonic()
+        if self._origin is None:
+            self._origin = now
+        t = (now - self._origin) / 3600
+        y = float(room_temperature)
+
+        if len(self._samples) >= self._size:
+            self._remove(*self._samples.popleft())
+        self._samples.append((t, y))
+        self._sum_t += t
+        self._sum_y += y
+        self._sum_tt += t * t
+        self._sum_ty += t * y
+        self._room_temperature = y
+
+    def _remove(self, t: float, y: float) -> None:
+        """Drop an evicted sample from the running sums."""
+        self._sum_t -= t
+        self._sum_y -= y
+        self._sum_tt -= t * t
+        self._sum_ty -= t * y
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Return the room temperature rate of change in °C/h."""
+        n = len(self._samples)
+        if n < 2:
+            return None
+        if self._samples[-1][0] - self._samples[0][0] < TREND_MIN_SPAN:
+            return None
+
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 0:
+            return None
+        return round((n * self._sum_ty - self._sum_t * self._sum_y) / denominator, 2)
+
+    @property
+    def minutes_to_target(self) -> Optional[int]:
+        """Return the estimated minutes until the setpoint is reached."""
+        if self._room_temperature is None or self._target_temperature is None:
+            return None
+
+        difference = self._target_temperature - self._room_temperature
+        if abs(difference) <= TREND_TARGET_TOLERANCE:
+            return 0
+
+        rate = self.rate
+        if not rate or (rate > 0) != (difference > 0):
+            return None
+        return round(difference / rate * 60)
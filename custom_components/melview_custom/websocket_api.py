@@ -0,0 +1,169 @@
+"""WebSocket API for the MELView Climate integration."""
+from typing import Any, Dict
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, MEL_HUB, SIGNAL_FLEET_UPDATE
+
+ATTR_NAME = "name"
+ATTR_AVAILABLE = "available"
+ATTR_LAST_UPDATE_AGE = "last_update_age"
+ATTR_CAPABILITIES = "capabilities"
+ATTR_UNITS = "units"
+ATTR_COMMANDS = "commands"
+
+STATUS_FIELDS = (
+    "power",
+    "operation_mode",
+    "room_temperature",
+    "target_temperature",
+    "fan_speed",
+    "vane_horizontal",
+    "vane_vertical",
+)
+
+CAPABILITY_FIELDS = (
+    "operation_modes",
+    "fan_speeds",
+    "vane_horizontal_positions",
+    "vane_vertical_positions",
+    "target_temperature_min",
+    "target_temperature_max",
+    "temperature_increment",
+)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the MELView WebSocket commands."""
+    websocket_api.async_register_command(hass, websocket_fleet_state)
+    websocket_api.async_register_command(hass, websocket_subscribe_fleet_state)
+
+
+def _json_value(value):
+    """Return a JSON friendly copy of a pymelview value."""
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return value
+
+
+def _unit_snapshot(mel_device) -> Dict[str, Any]:
+    """Return the cached state of a single unit."""
+    device = mel_device.device
+    status = {field: _json_value(getattr(device, field)) for field in STATUS_FIELDS}
+    status["error_state"] = mel_device.error_state
+
+    age = mel_device.last_update_age
+    return {
+        ATTR_NAME: mel_device.name,
+        ATTR_AVAILABLE: mel_device.available,
+        ATTR_LAST_UPDATE_AGE: round(age, 1) if age is not None else None,
+        "status": status,
+        ATTR_CAPABILITIES: {
+            field: _json_value(getattr(device, field)) for field in CAPABILITY_FIELDS
+        },
+    }
+
+
+@callback
+def async_fleet_snapshot(hass: HomeAssistant) -> Dict[str, Dict[str, Any]]:
+    """Return the cached state of every unit of every config entry."""
+    units = {}
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        for mel_device in entry_data[MEL_HUB].devices:
+            units[str(mel_device.device_id)] = _unit_snapshot(mel_device)
+    return units
+
+
+@callback
+def async_command_statistics(hass: HomeAssistant) -> Dict[str, Dict[str, Any]]:
+    """Return the command confirmation statistics of every config entry."""
+    return {
+        entry_id: entry_data[MEL_HUB].command_statistics
+        for entry_id, entry_data in hass.data.get(DOMAIN, {}).items()
+    }
+
+
+def _unit_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the fields of a unit that changed between two snapshots."""
+    delta = {}
+    for key, value in new.items():
+        if key == ATTR_LAST_UPDATE_AGE:
+            continue
+        old_value = old.get(key)
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            changed = {
+                field: field_value
+                for field, field_value in value.items()
+                if old_value.get(field) != field_value
+            }
+            if changed:
+                delta[key] = changed
+        elif value != old_value:
+            delta[key] = value
+
+    if delta:
+        delta[ATTR_LAST_UPDATE_AGE] = new[ATTR_LAST_UPDATE_AGE]
+    return delta
+
+
+@websocket_api.websocket_command({vol.Required("type"): "melview_custom/fleet_state"})
+@callback
+def websocket_fleet_state(hass: HomeAssistant, connection, msg) -> None:
+    """Return the cached state of all units."""
+    connection.send_result(
+        msg["id"],
+        {
+            ATTR_UNITS: async_fleet_snapshot(hass),
+            ATTR_COMMANDS: async_command_statistics(hass),
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "melview_custom/subscribe_fleet_state"}
+)
+@callback
+def websocket_subscribe_fleet_state(hass: HomeAssistant, connection, msg) -> None:
+    """Send the state of all units, then only the changes after each refresh."""
+    last_units = async_fleet_snapshot(hass)
+    last_commands = async_command_statistics(hass)
+
+    @callback
+    def async_fleet_updated() -> None:
+        """Send the units and command totals that changed since the last message."""
+        nonlocal last_units, last_commands
+        units = async_fleet_snapshot(hass)
+        commands = async_command_statistics(hass)
+        deltas = {}
+        for device_id, unit in units.items():
+            delta = _unit_delta(last_units.get(device_id, {}), unit)
+            if delta:
+                deltas[device_id] = delta
+        for device_id in last_units.keys() - units.keys():
+            deltas[device_id] = None
+
+        event = {}
+        if deltas:
+            event[ATTR_UNITS] = deltas
+        if commands != last_commands:
+            event[ATTR_COMMANDS] = commands
+
+        last_units = units
+        last_commands = commands
+        if event:
+            connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_FLEET_UPDATE, async_fleet_updated
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"], {ATTR_UNITS: last_units, ATTR_COMMANDS: last_commands}
+        )
+    )